@@ -0,0 +1,124 @@
+"""Benchmark repeat-view latency and DB queries per request for moodboard reads.
+
+Runs the app in-process against an in-memory SQLite database and times cold,
+warm and 304 views of ``GET /moodboards/{id}`` and ``GET /moodboards?ids=``,
+with the paginated listing as a baseline.
+
+    python benchmark_moodboards.py [--boards 200] [--batch 20] [--iterations 200]
+"""
+import argparse
+import os
+import statistics
+import time
+
+# main.py reads its settings at import time
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("OPENAI_API_KEY", "benchmark")
+os.environ.setdefault("SERPAPI_KEY", "benchmark")
+os.environ.setdefault("CORS_ORIGINS", "http://localhost:3000")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import main
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self._on_execute)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def seed(session_factory, boards: int):
+    db = session_factory()
+    try:
+        for i in range(boards):
+            db.add(main.Moodboard(
+                title=f"Board {i} Moodboard",
+                description="A calm, minimal board " * 5,
+                content={
+                    "theme": f"theme {i}",
+                    "color_palette": ["#112233", "#445566", "#778899"],
+                    "content": {"description": "text " * 200},
+                    "images": [f"https://example.com/{i}/{n}.jpg" for n in range(5)],
+                },
+            ))
+        db.commit()
+    finally:
+        db.close()
+
+
+def measure(client, counter, url, iterations, headers=None, before=None, expect=200):
+    timings = []
+    queries = []
+    for _ in range(iterations):
+        if before:
+            before()
+        start_queries = counter.count
+        start = time.perf_counter()
+        response = client.get(url, headers=headers or {})
+        timings.append((time.perf_counter() - start) * 1000)
+        queries.append(counter.count - start_queries)
+        assert response.status_code == expect, (url, response.status_code)
+    return statistics.median(timings), statistics.mean(queries), len(response.content)
+
+
+def main_benchmark(boards: int, batch: int, iterations: int):
+    engine = create_engine(
+        "sqlite://",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    main.Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed(session_factory, boards)
+
+    def get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[main.get_db] = get_db
+    counter = QueryCounter(engine)
+    cache = main.moodboard_cache
+    client = TestClient(main.app)
+
+    single_url = "/moodboards/1"
+    ids = ",".join(str(i) for i in range(1, batch + 1))
+    multi_url = f"/moodboards?ids={ids}"
+    single_etag = client.get(single_url).headers["ETag"]
+    multi_etag = client.get(multi_url).headers["ETag"]
+
+    scenarios = [
+        ("list ?limit=%d (baseline)" % batch, f"/moodboards?limit={batch}", None, None, 200),
+        ("single cold", single_url, None, cache.clear, 200),
+        ("single warm", single_url, None, None, 200),
+        ("single 304", single_url, {"If-None-Match": single_etag}, None, 304),
+        ("ids=%d cold" % batch, multi_url, None, cache.clear, 200),
+        ("ids=%d warm" % batch, multi_url, None, None, 200),
+        ("ids=%d 304" % batch, multi_url, {"If-None-Match": multi_etag}, None, 304),
+    ]
+
+    print(f"{boards} boards, {iterations} iterations per scenario (median latency)")
+    print(f"{'scenario':<28}{'latency ms':>12}{'queries/req':>13}{'bytes':>9}")
+    for name, url, headers, before, expect in scenarios:
+        hits, misses = cache.hits, cache.misses
+        latency, queries, size = measure(client, counter, url, iterations, headers, before, expect)
+        print(f"{name:<28}{latency:>12.3f}{queries:>13.2f}{size:>9}"
+              f"   cache hits={cache.hits - hits} misses={cache.misses - misses}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--boards", type=int, default=200)
+    parser.add_argument("--batch", type=int, default=20)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+    main_benchmark(args.boards, args.batch, args.iterations)
@@ -19,6 +19,10 @@ class Settings(BaseSettings):
             return self.DATABASE_URL
         return self.DATABASE_URL.replace("postgres://", "postgresql://")
     
+    # Moodboard read cache
+    MOODBOARD_CACHE_SIZE: int = 512
+    MOODBOARD_MULTI_GET_LIMIT: int = 100
+    
     # API Keys
     OPENAI_API_KEY: str
     SERPAPI_KEY: str
@@ -1,11 +1,13 @@
-from fastapi import FastAPI, HTTPException, Depends
+from fastapi import FastAPI, HTTPException, Depends, Header, Path, Response
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy import create_engine, Column, Integer, String, Boolean, DateTime, ForeignKey, JSON
-from sqlalchemy.sql import func
+from sqlalchemy import create_engine, inspect, text, Column, Integer, String, Boolean, DateTime, ForeignKey, JSON
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.sql import func, literal_column
 import os
-from typing import List
+from typing import List, Optional
 from pydantic import BaseModel
 from datetime import datetime
 import json
@@ -13,10 +15,20 @@ import json
 from config import settings
 from ai_generator import AIGenerator
 from pinterest_api import fetch_pinterest_images
+from moodboard_cache import MoodboardCache, combine_etags, etag_matches
 
 # Initialize AI Generator
 ai_generator = AIGenerator()
 
+# Initialize moodboard read cache
+moodboard_cache = MoodboardCache(max_size=settings.MOODBOARD_CACHE_SIZE)
+
+# Clients must revalidate with If-None-Match before reusing a stored copy
+MOODBOARD_CACHE_CONTROL = "private, no-cache"
+
+# Ids must fit the database's 64-bit integer type
+MAX_MOODBOARD_ID = 2**63 - 1
+
 # Database setup
 engine = create_engine(settings.DATABASE_URL_ASYNC, pool_pre_ping=True)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
@@ -36,6 +48,9 @@ class User(Base):
 
 class Moodboard(Base):
     __tablename__ = "moodboards"
+    # Never reuse the id of a deleted board, so a cached (id, version) pair
+    # can't be mistaken for a new row in any worker
+    __table_args__ = {"sqlite_autoincrement": True}
     
     # Define columns with explicit SQLAlchemy types
     id = Column(Integer, primary_key=True, index=True)
@@ -45,9 +60,34 @@ class Moodboard(Base):
     user_id = Column(Integer, ForeignKey("users.id"))
     created_at = Column(DateTime, default=func.now())
     updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    # Bumped on every UPDATE; keys the read cache since updated_at only has
+    # one-second resolution on SQLite
+    version = Column(Integer, nullable=False, default=1, server_default="1",
+                     onupdate=literal_column("version + 1"))
+
+def migrate_moodboard_version(bind) -> None:
+    """Add ``moodboards.version`` to tables created before it existed.
+
+    ``create_all`` never alters existing tables, so deployed databases get
+    the column here. Safe to run on every startup and from several workers.
+    """
+    columns = {column["name"] for column in inspect(bind).get_columns("moodboards")}
+    if "version" in columns:
+        return
+    try:
+        with bind.begin() as conn:
+            conn.execute(text(
+                "ALTER TABLE moodboards ADD COLUMN version INTEGER NOT NULL DEFAULT 1"
+            ))
+    except DBAPIError:
+        # Another worker may have added it first
+        columns = {column["name"] for column in inspect(bind).get_columns("moodboards")}
+        if "version" not in columns:
+            raise
 
 # Create tables
 Base.metadata.create_all(bind=engine)
+migrate_moodboard_version(engine)
 
 # Dependency
 def get_db():
@@ -86,6 +126,73 @@ class MoodboardResponse(BaseModel):
     description: str
     content: dict
 
+def serialize_moodboard(moodboard: Moodboard) -> dict:
+    return {
+        "id": moodboard.id,
+        "title": moodboard.title,
+        "description": moodboard.description,
+        "content": moodboard.content,
+        "user_id": moodboard.user_id,
+        "created_at": moodboard.created_at.isoformat() if moodboard.created_at else None,
+        "updated_at": moodboard.updated_at.isoformat() if moodboard.updated_at else None,
+    }
+
+def load_moodboards(db: Session, ids: List[int]) -> dict:
+    """Resolve moodboards by id through the read cache.
+
+    One lightweight query fetches the current ``version`` of every
+    requested board; full rows are then loaded in a single query for the
+    boards that are missing from the cache or whose version changed.
+    Returns a mapping of id to ``(body, etag)`` for the boards that exist.
+    """
+    versions = dict(
+        db.query(Moodboard.id, Moodboard.version)
+        .filter(Moodboard.id.in_(ids))
+        .all()
+    )
+
+    resolved = {}
+    stale_ids = []
+    for moodboard_id, version in versions.items():
+        cached = moodboard_cache.get(moodboard_id, version)
+        if cached is None:
+            stale_ids.append(moodboard_id)
+        else:
+            resolved[moodboard_id] = cached
+
+    if stale_ids:
+        rows = db.query(Moodboard).filter(Moodboard.id.in_(stale_ids)).all()
+        for moodboard in rows:
+            body = serialize_moodboard(moodboard)
+            etag = moodboard_cache.put(moodboard.id, moodboard.version, body)
+            resolved[moodboard.id] = (body, etag)
+
+    return resolved
+
+def parse_ids(ids: str) -> List[int]:
+    try:
+        parsed = [int(part) for part in ids.split(",") if part.strip()]
+    except ValueError:
+        raise HTTPException(status_code=400, detail="ids must be a comma-separated list of integers")
+    if any(not 1 <= moodboard_id <= MAX_MOODBOARD_ID for moodboard_id in parsed):
+        raise HTTPException(status_code=400, detail=f"ids must be between 1 and {MAX_MOODBOARD_ID}")
+    if not parsed:
+        raise HTTPException(status_code=400, detail="ids must not be empty")
+    # Drop duplicates but keep the order the client asked for
+    unique = list(dict.fromkeys(parsed))
+    if len(unique) > settings.MOODBOARD_MULTI_GET_LIMIT:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.MOODBOARD_MULTI_GET_LIMIT} ids can be requested at once"
+        )
+    return unique
+
+def cached_response(body, etag: str, if_none_match: Optional[str]) -> Response:
+    headers = {"ETag": etag, "Cache-Control": MOODBOARD_CACHE_CONTROL}
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=body, headers=headers)
+
 @app.post("/generate-moodboard", response_model=MoodboardResponse)
 async def generate_moodboard(
     request: MoodboardRequest,
@@ -139,10 +246,33 @@ async def generate_moodboard(
 async def get_moodboards(
     skip: int = 0,
     limit: int = 10,
+    ids: Optional[str] = None,
+    if_none_match: Optional[str] = Header(None),
+    db: Session = Depends(get_db)
+):
+    if ids is None:
+        moodboards = db.query(Moodboard).offset(skip).limit(limit).all()
+        return [serialize_moodboard(moodboard) for moodboard in moodboards]
+
+    # Multi-get: resolve every requested board in one round of queries
+    requested = parse_ids(ids)
+    resolved = load_moodboards(db, requested)
+    found = [moodboard_id for moodboard_id in requested if moodboard_id in resolved]
+    body = [resolved[moodboard_id][0] for moodboard_id in found]
+    etag = combine_etags([f"{moodboard_id}:{resolved[moodboard_id][1]}" for moodboard_id in found])
+    return cached_response(body, etag, if_none_match)
+
+@app.get("/moodboards/{moodboard_id}")
+async def get_moodboard(
+    moodboard_id: int = Path(..., ge=1, le=MAX_MOODBOARD_ID),
+    if_none_match: Optional[str] = Header(None),
     db: Session = Depends(get_db)
 ):
-    moodboards = db.query(Moodboard).offset(skip).limit(limit).all()
-    return moodboards
+    resolved = load_moodboards(db, [moodboard_id])
+    if moodboard_id not in resolved:
+        raise HTTPException(status_code=404, detail="Moodboard not found")
+    body, etag = resolved[moodboard_id]
+    return cached_response(body, etag, if_none_match)
 
 if __name__ == "__main__":
     import uvicorn
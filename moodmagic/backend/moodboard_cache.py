@@ -0,0 +1,76 @@
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+
+class MoodboardCache:
+    """In-process LRU cache of serialized moodboards.
+
+    Entries are keyed by moodboard id and tagged with the row's
+    ``version`` counter, so a lookup only hits when the caller's
+    freshly-read version matches the cached one. This relies on ids never
+    being reused for a different row.
+
+    ``hits`` and ``misses`` count lookups, for benchmarking.
+    """
+
+    def __init__(self, max_size: int = 512):
+        self.max_size = max_size
+        self._entries: "OrderedDict[int, Tuple[Any, Dict[str, Any], str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, moodboard_id: int, version: Any) -> Optional[Tuple[Dict[str, Any], str]]:
+        """Return ``(body, etag)`` if cached at ``version``, else None."""
+        with self._lock:
+            entry = self._entries.get(moodboard_id)
+            if entry is None or entry[0] != version:
+                if entry is not None:
+                    # Stale version - drop it so it gets refilled
+                    del self._entries[moodboard_id]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(moodboard_id)
+            self.hits += 1
+            return entry[1], entry[2]
+
+    def put(self, moodboard_id: int, version: Any, body: Dict[str, Any]) -> str:
+        """Store a serialized moodboard and return its strong ETag."""
+        etag = make_etag(body)
+        if self.max_size <= 0:
+            return etag
+        with self._lock:
+            self._entries[moodboard_id] = (version, body, etag)
+            self._entries.move_to_end(moodboard_id)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return etag
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def make_etag(body: Any) -> str:
+    """Build a strong ETag from the canonical JSON form of a response body."""
+    payload = json.dumps(body, sort_keys=True, separators=(",", ":"), default=str)
+    return '"%s"' % hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def combine_etags(etags: List[str]) -> str:
+    """Build a strong ETag for a collection from its members' ETags."""
+    digest = hashlib.sha256(",".join(etags).encode("utf-8")).hexdigest()
+    return '"%s"' % digest
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an ``If-None-Match`` header value against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses weak comparison, so ignore any W/ prefix
+    candidates = [tag[2:] if tag.startswith("W/") else tag for tag in candidates]
+    return "*" in candidates or etag in candidates
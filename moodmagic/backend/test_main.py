@@ -0,0 +1,169 @@
+import os
+import unittest
+from datetime import datetime
+
+# main.py reads its settings at import time
+os.environ.setdefault("DATABASE_URL", "sqlite://")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ.setdefault("SERPAPI_KEY", "test")
+os.environ.setdefault("CORS_ORIGINS", "http://localhost:3000")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect, text, update
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+import main
+from config import settings
+
+
+class MoodboardReadTest(unittest.TestCase):
+    def setUp(self):
+        self.engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        main.Base.metadata.create_all(bind=self.engine)
+        self.Session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+
+        db = self.Session()
+        for title in ("First", "Second", "Third"):
+            db.add(main.Moodboard(title=title, description="desc", content={"theme": title}))
+        db.commit()
+        db.close()
+
+        def get_db():
+            db = self.Session()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        main.app.dependency_overrides[main.get_db] = get_db
+        main.moodboard_cache.clear()
+        self.client = TestClient(main.app)
+
+    def tearDown(self):
+        main.app.dependency_overrides.clear()
+        main.moodboard_cache.clear()
+
+    def update_title(self, moodboard_id, title, updated_at=None):
+        values = {"title": title}
+        if updated_at is not None:
+            # Pin updated_at as if the writes landed in the same second
+            values["updated_at"] = updated_at
+        db = self.Session()
+        db.execute(update(main.Moodboard).where(main.Moodboard.id == moodboard_id).values(**values))
+        db.commit()
+        db.close()
+
+    def test_get_moodboard_sets_validators(self):
+        response = self.client.get("/moodboards/1")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["title"], "First")
+        self.assertTrue(response.headers["ETag"].startswith('"'))
+        self.assertEqual(response.headers["Cache-Control"], main.MOODBOARD_CACHE_CONTROL)
+
+    def test_matching_if_none_match_returns_304(self):
+        etag = self.client.get("/moodboards/1").headers["ETag"]
+
+        response = self.client.get("/moodboards/1", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b"")
+        self.assertEqual(response.headers["ETag"], etag)
+
+    def test_unknown_moodboard_returns_404(self):
+        self.assertEqual(self.client.get("/moodboards/999").status_code, 404)
+
+    def test_out_of_range_moodboard_id_is_rejected(self):
+        self.assertEqual(self.client.get("/moodboards/0").status_code, 422)
+        self.assertEqual(self.client.get(f"/moodboards/{2**63}").status_code, 422)
+
+    def test_multi_get_keeps_order_dedupes_and_skips_missing(self):
+        response = self.client.get("/moodboards?ids=3,1,999,3,2")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([board["id"] for board in response.json()], [3, 1, 2])
+        self.assertIn("ETag", response.headers)
+
+    def test_multi_get_304(self):
+        etag = self.client.get("/moodboards?ids=1,2").headers["ETag"]
+
+        response = self.client.get("/moodboards?ids=1,2", headers={"If-None-Match": etag})
+
+        self.assertEqual(response.status_code, 304)
+
+    def test_multi_get_rejects_bad_ids(self):
+        limit = settings.MOODBOARD_MULTI_GET_LIMIT
+        too_many = ",".join(str(i) for i in range(1, limit + 2))
+        for ids in ("", ",", "1,abc", "0", str(2**63), "99999999999999999999", too_many):
+            with self.subTest(ids=ids[:20]):
+                self.assertEqual(self.client.get(f"/moodboards?ids={ids}").status_code, 400)
+
+    def test_multi_get_limit_counts_unique_ids(self):
+        limit = settings.MOODBOARD_MULTI_GET_LIMIT
+        ids = ",".join(["1"] * (limit + 1))
+
+        response = self.client.get(f"/moodboards?ids={ids}")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()), 1)
+
+    def test_list_and_multi_get_share_representation(self):
+        listed = self.client.get("/moodboards?limit=1").json()[0]
+        fetched = self.client.get("/moodboards?ids=1").json()[0]
+
+        self.assertEqual(listed, fetched)
+
+    def test_update_changes_body_and_etag(self):
+        first = self.client.get("/moodboards/1")
+
+        self.update_title(1, "Renamed")
+        second = self.client.get("/moodboards/1", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()["title"], "Renamed")
+        self.assertNotEqual(second.headers["ETag"], first.headers["ETag"])
+
+    def test_same_second_updates_change_body_and_etag(self):
+        same_second = datetime(2024, 1, 1, 12, 0, 0)
+        self.update_title(1, "Renamed once", updated_at=same_second)
+        first = self.client.get("/moodboards/1")
+
+        self.update_title(1, "Renamed twice", updated_at=same_second)
+        second = self.client.get("/moodboards/1", headers={"If-None-Match": first.headers["ETag"]})
+
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.json()["title"], "Renamed twice")
+        self.assertEqual(second.json()["updated_at"], first.json()["updated_at"])
+        self.assertNotEqual(second.headers["ETag"], first.headers["ETag"])
+
+
+class MigrateMoodboardVersionTest(unittest.TestCase):
+    def test_adds_missing_version_column(self):
+        engine = create_engine("sqlite://", poolclass=StaticPool)
+        with engine.begin() as conn:
+            # Schema as deployed before moodboards.version existed
+            conn.execute(text(
+                "CREATE TABLE moodboards (id INTEGER PRIMARY KEY, title VARCHAR(255), "
+                "description VARCHAR(1000), content JSON, user_id INTEGER, "
+                "created_at DATETIME, updated_at DATETIME)"
+            ))
+            conn.execute(text("INSERT INTO moodboards (id, title) VALUES (1, 'Old')"))
+
+        main.migrate_moodboard_version(engine)
+        # Running it again is a no-op
+        main.migrate_moodboard_version(engine)
+
+        columns = {column["name"] for column in inspect(engine).get_columns("moodboards")}
+        self.assertIn("version", columns)
+        with engine.connect() as conn:
+            version = conn.execute(text("SELECT version FROM moodboards WHERE id = 1")).scalar()
+        self.assertEqual(version, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
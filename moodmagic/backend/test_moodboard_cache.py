@@ -0,0 +1,78 @@
+import unittest
+
+from moodboard_cache import MoodboardCache, etag_matches, make_etag
+
+
+class MoodboardCacheTest(unittest.TestCase):
+    def test_hit_returns_body_and_etag(self):
+        cache = MoodboardCache(max_size=4)
+        body = {"id": 1, "title": "Calm"}
+        etag = cache.put(1, 1, body)
+
+        self.assertEqual(cache.get(1, 1), (body, etag))
+        self.assertEqual(etag, make_etag(body))
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertEqual((cache.hits, cache.misses), (1, 0))
+
+    def test_stale_version_misses_and_drops_entry(self):
+        cache = MoodboardCache(max_size=4)
+        cache.put(1, 1, {"id": 1})
+
+        self.assertIsNone(cache.get(1, 2))
+        # The stale entry is gone, so the old version no longer hits either
+        self.assertIsNone(cache.get(1, 1))
+        self.assertEqual((cache.hits, cache.misses), (0, 2))
+
+    def test_evicts_least_recently_used(self):
+        cache = MoodboardCache(max_size=2)
+        cache.put(1, 1, {"id": 1})
+        cache.put(2, 1, {"id": 2})
+        # Touch 1 so that 2 becomes the eviction candidate
+        cache.get(1, 1)
+        cache.put(3, 1, {"id": 3})
+
+        self.assertIsNotNone(cache.get(1, 1))
+        self.assertIsNone(cache.get(2, 1))
+        self.assertIsNotNone(cache.get(3, 1))
+
+    def test_zero_size_disables_caching(self):
+        cache = MoodboardCache(max_size=0)
+        etag = cache.put(1, 1, {"id": 1})
+
+        self.assertEqual(etag, make_etag({"id": 1}))
+        self.assertIsNone(cache.get(1, 1))
+
+    def test_clear(self):
+        cache = MoodboardCache(max_size=4)
+        cache.put(1, 1, {"id": 1})
+        cache.put(2, 1, {"id": 2})
+
+        cache.clear()
+        self.assertIsNone(cache.get(1, 1))
+        self.assertIsNone(cache.get(2, 1))
+
+
+class EtagMatchesTest(unittest.TestCase):
+    etag = '"abc"'
+
+    def test_missing_header(self):
+        self.assertFalse(etag_matches(None, self.etag))
+        self.assertFalse(etag_matches("", self.etag))
+
+    def test_exact_and_mismatch(self):
+        self.assertTrue(etag_matches('"abc"', self.etag))
+        self.assertFalse(etag_matches('"def"', self.etag))
+
+    def test_wildcard(self):
+        self.assertTrue(etag_matches("*", self.etag))
+
+    def test_weak_prefix_is_ignored(self):
+        self.assertTrue(etag_matches('W/"abc"', self.etag))
+
+    def test_comma_separated_list(self):
+        self.assertTrue(etag_matches('"def", W/"abc" ,"ghi"', self.etag))
+        self.assertFalse(etag_matches('"def", "ghi"', self.etag))
+
+
+if __name__ == "__main__":
+    unittest.main()